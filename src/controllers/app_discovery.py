@@ -15,6 +15,10 @@ EXCLUDE_KEYWORDS = {
     'agent','watchdog','monitor','telemetry','feedback','plugin','add-in','daemon','tool','utility'
 }
 
+SKIP_DIR_KEYWORDS = ('uninstall','installer','updates','update','setup')
+PENALIZED_KEYWORDS = ('helper','service','updater','install')
+PREFERRED_KEYWORDS = ('chrome','firefox','edge','code','word','excel','powerpnt','notepad++')
+
 PROGRAM_FILES_DIRS = [
     os.environ.get('ProgramFiles', r"C:\Program Files"),
     os.environ.get('ProgramFiles(x86)', r"C:\Program Files (x86)"),
@@ -67,9 +71,9 @@ def _score_candidate(name: str, meta: Dict[str, str]) -> float:
         score += 1.0
     if meta.get('ProductName'):
         score += 1.0
-    if any(s in low for s in ['helper','service','updater','install']):
+    if any(s in low for s in PENALIZED_KEYWORDS):
         score -= 0.5
-    if any(s in low for s in ['chrome','firefox','edge','code','word','excel','powerpnt','notepad++']):
+    if any(s in low for s in PREFERRED_KEYWORDS):
         score += 0.5
     return score
 
@@ -79,7 +83,8 @@ def _scan_dir_for_exes(base_dir: str, max_files: int = 30000) -> List[Dict]:
         return results
     count = 0
     for root, _dirs, files in os.walk(base_dir):
-        if any(skip in root.lower() for skip in ['uninstall','installer','updates','update','setup']):
+        root_low = root.lower()
+        if any(skip in root_low for skip in SKIP_DIR_KEYWORDS):
             continue
         for f in files:
             if count >= max_files:
@@ -206,14 +211,14 @@ def resolve_app(query: str, apps: Optional[List[Dict]] = None) -> Optional[Dict]
     q = (query or "").strip().lower()
     if not q:
         return None
-    # exact name
-    for app in apps:
-        if app['app_name'].lower() == q:
-            return app
-    # contains in app_name or vendor
+    # exact name wins outright; otherwise collect names/vendors containing the query.
+    # One pass lowercases each name once instead of once per pass.
     candidates = []
     for app in apps:
-        if q in app['app_name'].lower() or q in (app.get('vendor') or '').lower():
+        name = app['app_name'].lower()
+        if name == q:
+            return app
+        if q in name or q in (app.get('vendor') or '').lower():
             candidates.append(app)
     if candidates:
         candidates.sort(key=lambda x: (len(x['app_name']), x.get('vendor','')))
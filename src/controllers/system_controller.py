@@ -1,11 +1,12 @@
 # Enhanced System Controller with Tool Execution
 import pyautogui
-import pywinauto
 import subprocess
 import os
 import psutil
 import logging
 import webbrowser
+import functools
+import urllib.parse
 from typing import Dict, List, Optional, Any
 from .app_discovery import discover_installed_apps, resolve_app
 
@@ -15,26 +16,57 @@ class AdvancedSystemController:
         pyautogui.FAILSAFE = True
         self.logger = logging.getLogger(__name__)
         
+        # Bind the platform's "open with default handler" once
+        self._open_path = os.startfile if os.name == 'nt' else self._xdg_open
+        
+        # Resolve the default browser once instead of on every search
+        try:
+            self._browser = webbrowser.get()
+        except webbrowser.Error:
+            self._browser = None
+        
+        # Memoized app resolution, cleared whenever the registry is refreshed
+        self._resolve_app_cached = functools.lru_cache(maxsize=256)(self._resolve_app)
+        
+        # App-name list cache, rebuilt only when the registry version changes
+        self._apps_version = 0
+        self._cached_apps_version = -1
+        self._cached_apps: List[str] = []
+        
         # Dynamic app registry - updated in real-time
         self.refresh_app_registry()
     
     def refresh_app_registry(self) -> int:
         """Refresh the dynamic app registry"""
         self._app_registry = discover_installed_apps(rescan=True)
+        self._resolve_app_cached.cache_clear()
+        self._apps_version += 1
         self.logger.info(f"Discovered {len(self._app_registry)} applications")
         return len(self._app_registry)
     
     def get_all_available_apps(self) -> List[str]:
-        """Get list of all discoverable applications"""
-        return [app['app_name'] for app in self._app_registry]
+        """Get list of all discoverable applications (shared; do not mutate)"""
+        if self._cached_apps_version != self._apps_version:
+            self._cached_apps = [app['app_name'] for app in self._app_registry]
+            self._cached_apps_version = self._apps_version
+        return self._cached_apps
+    
+    @staticmethod
+    def _xdg_open(path: str):
+        """Non-Windows stand-in for os.startfile"""
+        subprocess.Popen(['xdg-open', path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    
+    def _resolve_app(self, query: str) -> Optional[Dict]:
+        """Resolve a normalized app query against the current registry"""
+        return resolve_app(query, self._app_registry)
     
     def open_any_application(self, app_name: str) -> Dict[str, Any]:
         """Open any application dynamically"""
-        app = resolve_app(app_name, self._app_registry)
+        app = self._resolve_app_cached((app_name or "").strip().lower())
         
         if app:
             try:
-                os.startfile(app['main_exe'])
+                self._open_path(app['main_exe'])
                 return {
                     "success": True,
                     "message": f"Opened {app['app_name']}",
@@ -45,7 +77,15 @@ class AdvancedSystemController:
         
         # Fallback: try system command
         try:
-            subprocess.Popen(app_name, shell=True)
+            # Detach stdio so the child never inherits (or blocks on) our console handles
+            subprocess.Popen(
+                app_name,
+                shell=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=False
+            )
             return {
                 "success": True,
                 "message": f"Opened {app_name} via system command",
@@ -61,8 +101,8 @@ class AdvancedSystemController:
     def web_search(self, query: str) -> bool:
         """Perform web search"""
         try:
-            search_url = f"https://www.google.com/search?q={query.replace(' ', '+')}"
-            webbrowser.open(search_url)
+            search_url = "https://www.google.com/search?" + urllib.parse.urlencode({"q": query})
+            (self._browser or webbrowser).open(search_url, new=2)
             return True
         except Exception as e:
             self.logger.error(f"Web search failed: {e}")
@@ -115,7 +155,7 @@ class AdvancedSystemController:
             
             elif operation == "open_file":
                 path = kwargs.get("path", "")
-                os.startfile(path)
+                self._open_path(path)
                 return {"success": True, "message": f"Opened: {path}"}
             
             # Add more file operations as needed
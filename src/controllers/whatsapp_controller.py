@@ -10,20 +10,68 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
 from webdriver_manager.chrome import ChromeDriverManager
-import time
+import os
+import asyncio
+import functools
+import threading
 import logging
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Persisted Chrome profile so WhatsApp Web's session survives restarts (no QR rescan)
+PROFILE_DIR = os.path.join(PROJECT_ROOT, "data", "whatsapp_profile")
+
+# chromedriver binary, resolved once per process
+_chromedriver_path: Optional[str] = None
+
+def _resolve_chromedriver() -> str:
+    """Resolve the chromedriver binary once per process"""
+    global _chromedriver_path
+    if _chromedriver_path is None:
+        # A pinned CHROMEDRIVER_PATH skips webdriver_manager's version check entirely
+        pinned = os.getenv("CHROMEDRIVER_PATH")
+        _chromedriver_path = pinned if pinned and os.path.isfile(pinned) else ChromeDriverManager().install()
+    return _chromedriver_path
+
+def _driver_locked(method):
+    """Serialize a public controller method on the instance's driver lock"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._driver_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 class WhatsAppController:
-    def __init__(self, headless=False):
+    # Locators are built once at class load instead of on every lookup
+    _SEARCH = (By.CSS_SELECTOR, "div[data-testid='chat-list-search'] div[contenteditable='true']")
+    _COMPOSE = (By.CSS_SELECTOR, "div[data-testid='conversation-compose-box-input']")
+    _CELL = (By.CSS_SELECTOR, "div[data-testid='cell-frame-container']")
+    # One round trip per poll, and misses return null instead of raising NoSuchElementException
+    _LOGIN_STATE_JS = (
+        "if (document.querySelector(\"#side, div[data-testid='chat-list-search']\")) return 'chat';"
+        "if (document.querySelector(\"div[data-testid='qr-code']\")) return 'qr';"
+        "return null;"
+    )
+    _HEADER_CSS = "#main header"
+    _MESSAGES_CSS = "div[data-testid='conversation-panel-messages'] div[class*='message'] span[data-testid='conversation-text']"
+
+    def __init__(self, headless=False, profile_dir: Optional[str] = None, block_images: bool = False):
         self.driver = None
         self.wait = None
         self.headless = headless
+        self.block_images = block_images
+        self.profile_dir = profile_dir or PROFILE_DIR
         self.is_logged_in = False
+        # A single WebDriver session is not safe for concurrent commands; every public
+        # driver method takes this lock, so sync and async callers run one at a time
+        self._driver_lock = threading.Lock()
+        # Stable UI nodes (search box, compose box) reused across calls
+        self._el_cache: Dict[str, WebElement] = {}
         
-        # Set up logging
-        logging.basicConfig(level=logging.INFO)
+        # Logging is configured by the application entry point
         self.logger = logging.getLogger(__name__)
         
     def initialize_driver(self):
@@ -32,7 +80,7 @@ class WhatsAppController:
             # Chrome options for better WhatsApp Web compatibility
             chrome_options = Options()
             if self.headless:
-                chrome_options.add_argument('--headless')
+                chrome_options.add_argument('--headless=new')  # full Chrome in headless mode, not the legacy shell
             
             # WhatsApp Web specific optimizations
             chrome_options.add_argument('--no-sandbox')
@@ -41,13 +89,32 @@ class WhatsAppController:
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             chrome_options.add_experimental_option('useAutomationExtension', False)
             
+            # Trim browser work the automation doesn't need (GPU, extensions, translate, notifications)
+            chrome_options.add_argument('--disable-gpu')
+            chrome_options.add_argument('--disable-extensions')
+            chrome_options.add_argument('--disable-features=Translate,InfiniteSessionRestore')
+            prefs = {"profile.default_content_setting_values.notifications": 2}
+            if self.block_images:
+                # Optional: chat media won't render, but the QR code is a canvas and still works
+                prefs["profile.managed_default_content_settings.images"] = 2
+            chrome_options.add_experimental_option("prefs", prefs)
+            
+            # Reuse a persistent profile so an existing WhatsApp session is restored
+            chrome_options.add_argument(f'--user-data-dir={os.path.abspath(self.profile_dir)}')
+            chrome_options.add_argument('--profile-directory=Default')
+            
             # User agent to avoid detection
             chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
             
-            # Create driver
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            self.wait = WebDriverWait(self.driver, 30)
+            # Return from navigation at DOMContentLoaded; explicit waits handle readiness
+            chrome_options.set_capability("pageLoadStrategy", "eager")
+            
+            self.driver = webdriver.Chrome(service=Service(_resolve_chromedriver()), options=chrome_options)
+            # No implicit wait, so explicit waits and presence checks are not stretched by it
+            self.driver.implicitly_wait(0)
+            # Poll faster than the 500ms default so waits return soon after the condition holds
+            self.wait = WebDriverWait(self.driver, 30, poll_frequency=0.1,
+                                      ignored_exceptions=(NoSuchElementException,))
             
             # Execute script to avoid detection
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
@@ -59,6 +126,7 @@ class WhatsAppController:
             self.logger.error(f"Failed to initialize driver: {e}")
             return False
     
+    @_driver_locked
     def login_to_whatsapp(self):
         """Open WhatsApp Web and wait for user to scan QR code"""
         try:
@@ -70,20 +138,19 @@ class WhatsAppController:
                 return False
             # Navigate to WhatsApp Web
             self.driver.get('https://web.whatsapp.com')
+            self._el_cache.clear()
             self.logger.info("Navigated to WhatsApp Web")
             # Wait for QR code or chat interface
-            print("Please scan the QR code in the browser window...")
             print("Waiting for login... (This may take up to 60 seconds)")
             try:
-                # Wait for either QR code or main interface
-                self.wait.until(
-                    lambda driver: self._is_qr_code_present() or self._is_chat_interface_present()
-                )
+                # Wait for either QR code or main interface; a restored session
+                # lands directly on the chat interface and skips the QR step
+                state = self.wait.until(self._login_state)
                 # If QR code is present, wait for login
-                if self._is_qr_code_present():
+                if state == 'qr':
                     print("QR Code detected. Please scan it with your phone...")
                     # Wait for chat interface after QR scan
-                    self.wait.until(lambda driver: self._is_chat_interface_present())
+                    self.wait.until(lambda driver: self._login_state(driver) == 'chat')
                 self.is_logged_in = True
                 self.logger.info("Successfully logged into WhatsApp Web")
                 print("✅ Successfully logged into WhatsApp Web!")
@@ -96,32 +163,26 @@ class WhatsAppController:
             self.logger.error(f"Failed to login to WhatsApp: {e}")
             return False
 
-    def _is_qr_code_present(self):
-        """Check if QR code is present on the page"""
-        if self.driver is None:
-            return False
+    def _login_state(self, driver) -> Optional[str]:
+        """Return 'chat', 'qr' or None from a single browser-side check"""
         try:
-            qr_code = self.driver.find_element(By.XPATH, "//div[@data-testid='qr-code']")
-            return qr_code.is_displayed()
+            return driver.execute_script(self._LOGIN_STATE_JS)
         except Exception:
-            return False
+            return None
 
-    def _is_chat_interface_present(self):
-        """Check if main chat interface is loaded"""
-        if self.driver is None:
-            return False
-        try:
-            # Look for the search box or chat list
-            search_box = self.driver.find_element(By.XPATH, "//div[@data-testid='chat-list-search']")
-            return search_box.is_displayed()
-        except Exception:
+    def _with_element(self, key: str, locate, use):
+        """Apply use() to a cached element, re-locating it once if it went stale"""
+        el = self._el_cache.get(key)
+        if el is not None:
             try:
-                # Alternative: look for the side panel
-                side_panel = self.driver.find_element(By.ID, "side")
-                return side_panel.is_displayed()
-            except Exception:
-                return False
+                return use(el)
+            except StaleElementReferenceException:
+                pass
+        el = locate()
+        self._el_cache[key] = el
+        return use(el)
 
+    @_driver_locked
     def send_message(self, contact_name: str, message: str) -> bool:
         """Send a message to a specific contact"""
         if self.driver is None or self.wait is None:
@@ -135,12 +196,13 @@ class WhatsAppController:
             if not self._search_contact(contact_name):
                 self.logger.error(f"Could not find contact: {contact_name}")
                 return False
-            # Find the message input box
-            message_box = self.wait.until(
-                EC.presence_of_element_located((By.XPATH, "//div[@data-testid='conversation-compose-box-input']"))
+            # Find the message input box and clear any existing text
+            message_box = self._with_element(
+                "compose",
+                lambda: self.wait.until(EC.presence_of_element_located(self._COMPOSE)),
+                lambda el: (el.clear(), el)[1]
             )
-            # Clear any existing text and send message
-            message_box.clear()
+            # Send message
             message_box.send_keys(message)
             message_box.send_keys(Keys.ENTER)
             self.logger.info(f"Message sent to {contact_name}: {message}")
@@ -157,62 +219,107 @@ class WhatsAppController:
             self.logger.error("Driver or wait not initialized.")
             return False
         try:
-            # Find search box
-            search_box = self.wait.until(
-                EC.presence_of_element_located((By.XPATH, "//div[@data-testid='chat-list-search']//div[@contenteditable='true']"))
+            # Find search box and clear any previous search
+            search_box = self._with_element(
+                "search_input",
+                lambda: self.wait.until(EC.presence_of_element_located(self._SEARCH)),
+                lambda el: (el.clear(), el)[1]
             )
-            # Clear search and enter contact name
-            search_box.clear()
+            # Enter contact name
             search_box.send_keys(contact_name)
-            # Wait a moment for search results
-            time.sleep(2)
+            # Expected-fast conditions get a short wait instead of fixed sleeps
+            short_wait = WebDriverWait(self.driver, 5)
+            # Compose box of the chat open before the switch, if any
+            previous_compose = self.driver.find_elements(*self._COMPOSE)
+            title = self._css_string(contact_name)
             # Try to click on the first search result
             try:
-                # Look for the contact in search results
+                # Wait for a result cell carrying the contact's title; the unfiltered chat
+                # list already has cells, so waiting on any cell could click the wrong chat.
+                # The name is quoted so apostrophes and quotes in it cannot break the selector
                 contact_element = self.wait.until(
-                    EC.element_to_be_clickable((By.XPATH, f"//span[@title='{contact_name}']"))
+                    EC.element_to_be_clickable(
+                        (By.CSS_SELECTOR, f"{self._CELL[1]} span[title={title}]")
+                    )
                 )
                 contact_element.click()
-                # Wait for chat to load
-                time.sleep(2)
-                return True
+                found_by_title = True
             except Exception:
                 # Alternative approach: click the first result
                 try:
-                    first_result = self.driver.find_element(By.XPATH, "//div[@data-testid='cell-frame-container'][1]")
+                    first_result = self.driver.find_element(*self._CELL)
                     first_result.click()
-                    time.sleep(2)
-                    return True
                 except Exception:
                     return False
+                found_by_title = False
+            if found_by_title:
+                # The chat has loaded once its header shows the contact
+                short_wait.until(EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, f"{self._HEADER_CSS} span[title={title}]")
+                ))
+            elif previous_compose:
+                # The contact's title is unknown here; wait for the old chat to be replaced instead
+                short_wait.until(EC.staleness_of(previous_compose[0]))
+            # Only now is the compose box the new chat's; it replaces any cached one
+            self._el_cache["compose"] = short_wait.until(EC.presence_of_element_located(self._COMPOSE))
+            return True
         except Exception as e:
             self.logger.error(f"Failed to search contact {contact_name}: {e}")
             return False
 
+    @staticmethod
+    def _css_string(value: str) -> str:
+        """Quote value as a CSS string literal for use in attribute selectors"""
+        return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+    @_driver_locked
     def get_recent_messages(self, count=5) -> List[str]:
         """Get recent messages from current chat"""
         if self.driver is None:
             self.logger.error("Driver not initialized.")
             return []
         try:
-            # Find message elements
-            messages = self.driver.find_elements(By.XPATH, "//div[@data-testid='conversation-panel-messages']//div[contains(@class, 'message')]")
-            recent_messages = []
-            for msg in messages[-count:]:
-                try:
-                    text = msg.find_element(By.XPATH, ".//span[@data-testid='conversation-text'").text
-                    recent_messages.append(text)
-                except Exception:
-                    continue
-            return recent_messages
+            # Extract the last N message texts browser-side in a single round trip
+            texts = self.driver.execute_script(
+                "const nodes = document.querySelectorAll(arguments[0]);"
+                "return Array.from(nodes).slice(-arguments[1]).map(n => n.innerText);",
+                self._MESSAGES_CSS,
+                count
+            )
+            return [text for text in (texts or []) if text]
         except Exception as e:
             self.logger.error(f"Failed to get recent messages: {e}")
             return []
     
+    async def login_to_whatsapp_async(self) -> bool:
+        """Async wrapper for login_to_whatsapp; runs off the event loop"""
+        return await self._run_in_thread(self.login_to_whatsapp)
+
+    async def send_message_async(self, contact_name: str, message: str) -> bool:
+        """Async wrapper for send_message; runs off the event loop"""
+        return await self._run_in_thread(self.send_message, contact_name, message)
+
+    async def get_recent_messages_async(self, count=5) -> List[str]:
+        """Async wrapper for get_recent_messages; runs off the event loop"""
+        return await self._run_in_thread(self.get_recent_messages, count)
+
+    async def _run_in_thread(self, func, *args):
+        """Run a blocking driver call in the default executor; func takes the driver lock itself"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+    
+    @_driver_locked
     def close(self):
-        """Close the browser and clean up"""
+        """Quit the browser and clean up"""
         if self.driver:
-            self.driver.quit()
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+            self._el_cache.clear()
+            self.wait = None
+            self.is_logged_in = False
             self.logger.info("WhatsApp controller closed")
 
 # Test function
@@ -237,4 +344,5 @@ def test_whatsapp_controller():
     controller.close()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     test_whatsapp_controller()
@@ -9,7 +9,8 @@ This module provides the AI brain components:
 Integration points for other components:
 """
 
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional
 from .intent_parser import AdvancedIntentParser
 from .context_manager import EnhancedContextManager
 from .voice_optimizer import VoiceRecognitionOptimizer
@@ -21,6 +22,21 @@ __all__ = [
     'VoiceRecognitionOptimizer'
 ]
 
+# Read-only defaults shared by every call instead of rebuilt per call
+_DEFAULT_INTENT: Mapping[str, Any] = MappingProxyType({
+    "intent": "conversation",
+    "action": None,
+    "target": None,
+    "confidence": 0.5,
+    "steps": ()
+})
+_EMPTY_SYSTEM_CONTEXT: Mapping[str, Any] = MappingProxyType({
+    "running_apps": (),
+    "recent_commands": (),
+    "user_preferences": MappingProxyType({}),
+    "success_rates": MappingProxyType({})
+})
+
 # API Documentation for teammates:
 class AIIntegrationAPI:
     """
@@ -31,7 +47,7 @@ class AIIntegrationAPI:
     """
     
     @staticmethod
-    def parse_user_command(command: str, available_apps: List[str]) -> Dict[str, Any]:
+    def parse_user_command(command: str, available_apps: List[str]) -> Mapping[str, Any]:
         """
         Parse user command into structured intent
         
@@ -48,17 +64,10 @@ class AIIntegrationAPI:
                 "steps": [...] # For multi-step commands
             }
         """
-        # Return a proper dictionary instead of pass
-        return {
-            "intent": "conversation",
-            "action": None,
-            "target": None,
-            "confidence": 0.5,
-            "steps": []
-        }
+        return _DEFAULT_INTENT
     
     @staticmethod
-    def get_system_context() -> Dict[str, Any]:
+    def get_system_context() -> Mapping[str, Any]:
         """
         Get current system context for decision making
         
@@ -70,13 +79,7 @@ class AIIntegrationAPI:
                 "success_rates": {...}
             }
         """
-        # Return a proper dictionary instead of pass
-        return {
-            "running_apps": [],
-            "recent_commands": [],
-            "user_preferences": {},
-            "success_rates": {}
-        }
+        return _EMPTY_SYSTEM_CONTEXT
     
     @staticmethod
     def optimize_voice_input(audio_data: bytes, text: str, confidence: float) -> Dict[str, Any]:
@@ -1,18 +1,34 @@
 import json
 import logging
 import os,sys
+import time
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
-from collections import deque
+from datetime import timedelta
+from collections import deque, OrderedDict, Counter
+from types import MappingProxyType
+from array import array
+import heapq
+from itertools import islice
+from operator import itemgetter
 
 class EnhancedContextManager:
+    # Verbs whose commands are grouped as "open_<app>" for tracking
+    _OPEN_VERBS = frozenset(("open", "launch", "start"))
+    
     def __init__(self, max_history: int = 50):
         self.logger = logging.getLogger(__name__)
         self.max_history = max_history
         
         # Context storage
-        self.conversation_history = deque(maxlen=max_history)
-        self.system_state = {
+        self.conversation_history: deque = deque(maxlen=max_history)
+        # Productive interactions among the last 10, kept as a sliding count
+        self._productive_window: int = min(10, max_history)
+        self._recent_productive: int = 0
+        # Intent name -> occurrences in conversation_history
+        self._intent_counter: Counter = Counter()
+        # Successful interactions in conversation_history
+        self._history_successes: int = 0
+        self.system_state: Dict[str, Any] = {
             "running_apps": [],
             "current_window": None,
             "recent_commands": deque(maxlen=20),
@@ -21,50 +37,104 @@ class EnhancedContextManager:
         }
         
         # AI learning data
-        self.command_success_rates = {}
-        self.app_usage_patterns = {}
-        self.user_behavior_patterns = {
-            "most_active_hours": [],
+        self.command_success_rates: Dict[str, Dict[str, Any]] = {}
+        # Running totals across all commands, kept in step with command_success_rates
+        self._total_attempts: int = 0
+        self._total_successes: int = 0
+        # Commands tried 3+ times with under 50% success (insertion-ordered set)
+        self._low_success_commands: Dict[str, None] = {}
+        self.app_usage_patterns: Dict[str, Dict[str, Any]] = {}
+        # Incrementally maintained top apps; counts only grow, so the max is a simple compare
+        self._top_app: Optional[str] = None
+        self._top_app_count: int = 0
+        self._frequent_apps: List[str] = []
+        # Flat app -> count mirror of app_usage_patterns[app]["count"] for ranking
+        self._app_counts: Dict[str, int] = {}
+        self._frequent_apps_dirty: bool = False
+        # App -> last_used, ordered least to most recently used
+        self._apps_by_recency: "OrderedDict[str, float]" = OrderedDict()
+        self.user_behavior_patterns: Dict[str, Any] = {
+            # Interactions per hour of day, indexed 0-23
+            "most_active_hours": array('I', [0] * 24),
             "command_frequency": {},
-            "error_patterns": []
+            "error_patterns": deque(maxlen=50)  # Keep only recent errors
         }
         
+        # Read-only live views handed out in the context instead of per-call copies;
+        # the underlying dicts are never rebound, so the views stay valid
+        self._system_state_view = MappingProxyType(self.system_state)
+        self._success_rates_view = MappingProxyType(self.command_success_rates)
+        self._usage_patterns_view = MappingProxyType(self.app_usage_patterns)
+        self._behavior_patterns_view = MappingProxyType(self.user_behavior_patterns)
+        
+        # Cached get_current_context() result, rebuilt after state changes or once stale
+        self._ctx_cache: Optional[Dict[str, Any]] = None
+        self._ctx_dirty: bool = True
+        self._ctx_cache_ts: float = 0.0
+        self._ctx_cache_ttl: float = 5.0  # time-based fields (session duration, recent apps) drift
+        
         # Load persistent data
         self._load_persistent_data()
         
     def add_interaction(self, user_input: str, assistant_response: str, 
                        intent: Dict[str, Any], success: bool = True):
         """Add interaction to context with comprehensive tracking"""
+        # Read the clock once and share it with every helper below; timestamps are
+        # stored as epoch seconds and only formatted for display
+        now = time.time()
+        local = time.localtime(now)
         interaction = {
-            "timestamp": datetime.now(),
+            "timestamp": now,
             "user_input": user_input,
             "assistant_response": assistant_response,
             "intent": intent,
             "success": success,
-            "session_info": self._get_session_info()
+            "session_info": self._get_session_info(now, local)
         }
         
+        # Slide the productivity window: drop the interaction leaving it, add the new one
+        if len(self.conversation_history) >= self._productive_window:
+            self._recent_productive -= self._is_productive(self.conversation_history[-self._productive_window])
+        self._recent_productive += self._is_productive(interaction)
+        if len(self.conversation_history) == self.conversation_history.maxlen:
+            oldest = self.conversation_history[0]
+            evicted = oldest["intent"].get("intent", "unknown")
+            self._intent_counter[evicted] -= 1
+            if not self._intent_counter[evicted]:
+                del self._intent_counter[evicted]
+            self._history_successes -= oldest["success"]
+        self._intent_counter[intent.get("intent", "unknown")] += 1
+        self._history_successes += success
         self.conversation_history.append(interaction)
-        self._update_learning_data(user_input, success, intent)
+        self._update_learning_data(user_input, success, intent, now, local.tm_hour)
+        self._ctx_dirty = True
         self._save_interaction_to_persistence(interaction)
         
     def get_current_context(self) -> Dict[str, Any]:
         """Get comprehensive current context with AI insights"""
-        return {
-            "recent_interactions": list(self.conversation_history)[-5:],
-            "system_state": self.system_state.copy(),
-            "success_rates": dict(self.command_success_rates),
-            "usage_patterns": dict(self.app_usage_patterns),
-            "behavior_patterns": self.user_behavior_patterns.copy(),
+        ts = time.monotonic()
+        if not self._ctx_dirty and self._ctx_cache is not None and ts - self._ctx_cache_ts < self._ctx_cache_ttl:
+            # Shallow copy: callers add their own keys (e.g. available_apps) to the result
+            return dict(self._ctx_cache)
+        self._ctx_cache = {
+            "recent_interactions": self._recent_interactions(5),
+            "system_state": self._system_state_view,
+            "success_rates": self._success_rates_view,
+            "usage_patterns": self._usage_patterns_view,
+            "behavior_patterns": self._behavior_patterns_view,
             "context_summary": self._generate_context_summary(),
             "ai_insights": self._generate_ai_insights(),
             "session_stats": self._get_session_stats()
         }
+        self._ctx_dirty = False
+        self._ctx_cache_ts = ts
+        return dict(self._ctx_cache)
     
     def update_system_state(self, key: str, value: Any):
         """Update system state with automatic learning"""
         old_value = self.system_state.get(key)
         self.system_state[key] = value
+        self._ctx_dirty = True
         
         # Track state changes for learning
         if key == "running_apps" and old_value != value:
@@ -74,97 +144,112 @@ class EnhancedContextManager:
             )
 
         
-        self.logger.debug(f"Updated system state: {key} = {value}")
+        self.logger.debug("Updated system state: %s = %s", key, value)
     
-    def _update_learning_data(self, command: str, success: bool, intent: Dict[str, Any]):
+    def _update_learning_data(self, command: str, success: bool, intent: Dict[str, Any],
+                              now: float, hour: int):
         """Update all learning data structures"""
+        # Normalize once; both success rates and command frequency key on it
+        command_key = self._normalize_command(command)
+        
         # Update success rates
-        self._update_success_rates(command, success)
+        self._update_success_rates(command_key, success, now)
         
         # Update usage patterns
-        self._update_usage_patterns(intent)
+        self._update_usage_patterns(intent, now)
         
         # Update behavior patterns
-        self._update_behavior_patterns(command, success)
+        self._update_behavior_patterns(command, command_key, success, now, hour)
     
-    def _update_success_rates(self, command: str, success: bool):
+    def _update_success_rates(self, command_key: str, success: bool, now: float):
         """Track command success rates with pattern recognition"""
-        command_key = self._normalize_command(command)
-        
-        if command_key not in self.command_success_rates:
-            self.command_success_rates[command_key] = {
+        entry = self.command_success_rates.get(command_key)
+        if entry is None:
+            entry = self.command_success_rates[command_key] = {
                 "successes": 0, 
                 "attempts": 0, 
                 "recent_attempts": deque(maxlen=10),
-                "first_seen": datetime.now()
+                "first_seen": now
             }
         
-        self.command_success_rates[command_key]["attempts"] += 1
-        self.command_success_rates[command_key]["recent_attempts"].append({
+        entry["attempts"] += 1
+        self._total_attempts += 1
+        entry["recent_attempts"].append({
             "success": success,
-            "timestamp": datetime.now()
+            "timestamp": now
         })
         
         if success:
-            self.command_success_rates[command_key]["successes"] += 1
+            entry["successes"] += 1
+            self._total_successes += 1
+        
+        # Only consider commands tried multiple times
+        if entry["attempts"] >= 3 and entry["successes"] / entry["attempts"] < 0.5:
+            self._low_success_commands[command_key] = None
+        else:
+            self._low_success_commands.pop(command_key, None)
     
-    def _update_usage_patterns(self, intent: Dict[str, Any]):
+    def _update_usage_patterns(self, intent: Dict[str, Any], now: float):
         """Track comprehensive app usage patterns"""
         if intent.get("intent") == "system_control" and intent.get("target"):
             app = intent["target"]
-            current_time = datetime.now()
+            current_time = now
             
             if app not in self.app_usage_patterns:
                 self.app_usage_patterns[app] = {
                     "count": 0,
                     "last_used": None,
-                    "usage_times": [],
+                    "usage_times": deque(),
                     "success_rate": 1.0,
-                    "common_tasks": []
+                    "common_tasks": set()
                 }
             
             pattern = self.app_usage_patterns[app]
             pattern["count"] += 1
+            self._app_counts[app] = pattern["count"]
             pattern["last_used"] = current_time
-            pattern["usage_times"].append(current_time)
+            if pattern["count"] > self._top_app_count:
+                self._top_app = app
+                self._top_app_count = pattern["count"]
+            self._frequent_apps_dirty = True
+            self._apps_by_recency[app] = current_time
+            self._apps_by_recency.move_to_end(app)
+            usage_times = pattern["usage_times"]
+            usage_times.append(current_time)
             
-            # Keep only recent usage times (last 30 days)
-            cutoff = current_time - timedelta(days=30)
-            pattern["usage_times"] = [t for t in pattern["usage_times"] if t > cutoff]
+            # Keep only recent usage times (last 30 days); entries are in time order,
+            # so expired ones are always at the front
+            cutoff = current_time - 30 * 86400
+            while usage_times[0] <= cutoff:
+                usage_times.popleft()
             
             # Track common tasks
             if intent.get("steps"):
                 for step in intent["steps"]:
                     task = step.get("task_type")
-                    if task and task not in pattern["common_tasks"]:
-                        pattern["common_tasks"].append(task)
+                    if task:
+                        pattern["common_tasks"].add(sys.intern(task))
     
-    def _update_behavior_patterns(self, command: str, success: bool):
+    def _update_behavior_patterns(self, command: str, command_key: str, success: bool,
+                                  now: float, hour: int):
         """Track user behavior patterns for AI insights"""
-        current_hour = datetime.now().hour
+        current_hour = hour
         
         # Track active hours
-        if current_hour not in self.user_behavior_patterns["most_active_hours"]:
-            self.user_behavior_patterns["most_active_hours"].append(current_hour)
+        self.user_behavior_patterns["most_active_hours"][current_hour] += 1
         
         # Track command frequency
-        cmd_normalized = self._normalize_command(command)
         freq = self.user_behavior_patterns["command_frequency"]
-        freq[cmd_normalized] = freq.get(cmd_normalized, 0) + 1
+        freq[command_key] = freq.get(command_key, 0) + 1
         
         # Track error patterns
         if not success:
             error_pattern = {
                 "command": command,
-                "timestamp": datetime.now(),
+                "timestamp": now,
                 "hour": current_hour
             }
             self.user_behavior_patterns["error_patterns"].append(error_pattern)
-            
-            # Keep only recent errors (last 50)
-            if len(self.user_behavior_patterns["error_patterns"]) > 50:
-                self.user_behavior_patterns["error_patterns"] = \
-                    self.user_behavior_patterns["error_patterns"][-50:]
     
     def _track_app_state_change(self, old_apps: Optional[List[str]], new_apps: Optional[List[str]]):
         """Track when apps are opened/closed for context"""
@@ -210,22 +295,15 @@ class EnhancedContextManager:
         insights = []
         
         # Usage pattern insights
-        if self.app_usage_patterns:
-            try:
-                most_used = max(self.app_usage_patterns.items(), 
-                            key=lambda x: x[1]["count"])
-                if isinstance(most_used, tuple) and len(most_used) == 2:
-                    app_name, app_data = most_used
-                    if isinstance(app_data, dict) and "count" in app_data:
-                        insights.append(f"Most used app: {app_name} ({app_data['count']} times)")
-            except (ValueError, KeyError, TypeError) as e:
-                self.logger.debug(f"Error getting most used app: {e}")
-
+        if self._top_app is not None:
+            insights.append(f"Most used app: {self._top_app} ({self._top_app_count} times)")
         
         # Time-based insights
         active_hours = self.user_behavior_patterns["most_active_hours"]
-        if active_hours:
-            avg_hour = sum(active_hours) // len(active_hours)
+        total_active = sum(active_hours)
+        if total_active:
+            # Mean hour weighted by how many interactions happened in each hour
+            avg_hour = sum(hour * count for hour, count in enumerate(active_hours)) // total_active
             if 9 <= avg_hour <= 17:
                 insights.append("Primary usage during work hours")
             elif 18 <= avg_hour <= 23:
@@ -242,22 +320,13 @@ class EnhancedContextManager:
         """Get AI-powered recommendations"""
         recommendations = []
         
-        # App recommendations based on usage
-        try:
-            frequent_apps = sorted(self.app_usage_patterns.items(), 
-                                key=lambda x: x[1].get("count", 0), reverse=True)[:3]
-            
-            if frequent_apps:
-                app_names = []
-                for item in frequent_apps:
-                    if isinstance(item, tuple) and len(item) >= 1:
-                        app_names.append(item[0])
-                
-                if app_names:
-                    recommendations.append(f"Quick access: {', '.join(app_names)}")
-        except (ValueError, KeyError, TypeError) as e:
-            self.logger.debug(f"Error getting frequent apps: {e}")
-
+        # App recommendations based on usage; re-rank only when usage changed since the last call
+        if self._frequent_apps_dirty:
+            self._frequent_apps = [app for app, _ in heapq.nlargest(
+                3, self._app_counts.items(), key=itemgetter(1))]
+            self._frequent_apps_dirty = False
+        if self._frequent_apps:
+            recommendations.append(f"Quick access: {', '.join(self._frequent_apps)}")
         
         # Productivity recommendations
         if self._should_suggest_break():
@@ -272,35 +341,35 @@ class EnhancedContextManager:
     
     def _get_recently_used_apps(self, minutes: int = 30) -> List[str]:
         """Get apps used in the last N minutes"""
-        cutoff = datetime.now() - timedelta(minutes=minutes)
+        cutoff = time.time() - minutes * 60
         recent = []
         
-        for app, data in self.app_usage_patterns.items():
-            if data["last_used"] and data["last_used"] > cutoff:
-                recent.append(app)
+        # Walk from the most recent app and stop at the first one outside the window
+        for app in reversed(self._apps_by_recency):
+            if self._apps_by_recency[app] <= cutoff:
+                break
+            recent.append(app)
         
         return recent
     
+    @staticmethod
+    def _is_productive(interaction: Dict[str, Any]) -> bool:
+        """Whether an interaction counts toward the productivity window"""
+        return interaction["success"] and interaction["intent"].get("intent") != "conversation"
+    
     def _is_productive_session(self) -> bool:
         """Determine if current session shows high productivity"""
         if len(self.conversation_history) < 5:
             return False
         
-        recent_interactions = list(self.conversation_history)[-10:]
-        successful_actions = sum(1 for i in recent_interactions 
-                               if i["success"] and i["intent"].get("intent") != "conversation")
-        
-        return successful_actions >= 3
+        return self._recent_productive >= 3
     
     def _get_average_success_rate(self) -> float:
         """Calculate overall success rate"""
         if not self.command_success_rates:
             return 0.8  # Default assumption
         
-        total_attempts = sum(data["attempts"] for data in self.command_success_rates.values())
-        total_successes = sum(data["successes"] for data in self.command_success_rates.values())
-        
-        return total_successes / max(1, total_attempts)
+        return self._total_successes / max(1, self._total_attempts)
     
     def _should_suggest_break(self) -> bool:
         """Suggest break based on usage patterns"""
@@ -309,67 +378,63 @@ class EnhancedContextManager:
         
         # Check if user has been active for more than 2 hours
         first_interaction = self.conversation_history[0]["timestamp"]
-        time_active = datetime.now() - first_interaction
+        time_active = time.time() - first_interaction
         
-        return time_active > timedelta(hours=2)
+        return time_active > 2 * 3600
     
     def _get_low_success_commands(self) -> List[str]:
         """Get commands with low success rates"""
-        low_success = []
-        
-        for cmd, data in self.command_success_rates.items():
-            if data["attempts"] >= 3:  # Only consider commands tried multiple times
-                success_rate = data["successes"] / data["attempts"]
-                if success_rate < 0.5:
-                    low_success.append(cmd)
-        
-        return low_success[:3]  # Return top 3
+        return list(islice(self._low_success_commands, 3))  # Return top 3
     
     def _normalize_command(self, command: str) -> str:
         """Normalize commands for consistent tracking"""
         # Remove common variations
-        normalized = command.lower().strip()
-        normalized = ' '.join(normalized.split())  # Remove extra spaces
+        words = command.lower().split()
+        normalized = ' '.join(words)  # Remove extra spaces
         
-        # Group similar commands
-        if any(word in normalized for word in ["open", "launch", "start"]):
-            words = normalized.split()
-            if len(words) >= 2:
-                return f"open_{words[-1]}"  # "open_firefox", "launch_word" -> "open_firefox"
+        # Group similar commands; match whole words so "startup" or "reopen" don't count
+        if len(words) >= 2 and not self._OPEN_VERBS.isdisjoint(words):
+            return sys.intern(f"open_{words[-1]}")  # "open_firefox", "launch_word" -> "open_firefox"
         
-        return normalized
+        # Interned so repeated commands share one key object across the tracking dicts
+        return sys.intern(normalized)
     
     def _get_environment_info(self) -> Dict[str, Any]:
         """Get system environment information"""
         return {
             "platform": os.name,
-            "session_start": datetime.now(),
+            "session_start": time.time(),
             "python_version": f"{sys.version_info.major}.{sys.version_info.minor}"
         }
     
-    def _get_session_info(self) -> Dict[str, Any]:
+    def _get_session_info(self, now: float, local: time.struct_time) -> Dict[str, Any]:
         """Get current session information"""
         return {
             "session_length": len(self.conversation_history),
-            "current_time": datetime.now(),
-            "day_of_week": datetime.now().strftime("%A"),
-            "hour": datetime.now().hour
+            "current_time": now,
+            "day_of_week": time.strftime("%A", local),
+            "hour": local.tm_hour
         }
     
+    def _recent_interactions(self, n: int) -> List[Dict[str, Any]]:
+        """Last n interactions, oldest first, without copying the whole history"""
+        history = self.conversation_history
+        return [history[i] for i in range(max(0, len(history) - n), len(history))]
+    
     def _get_session_stats(self) -> Dict[str, Any]:
         """Get session statistics"""
         if not self.conversation_history:
             return {"total_interactions": 0}
         
-        interactions = list(self.conversation_history)
-        successful = sum(1 for i in interactions if i["success"])
+        total = len(self.conversation_history)
+        successful = self._history_successes
         
         return {
-            "total_interactions": len(interactions),
+            "total_interactions": total,
             "successful_interactions": successful,
-            "success_rate": successful / len(interactions),
-            "session_duration": str(datetime.now() - interactions[0]["timestamp"]),
-            "unique_intents": len(set(i["intent"].get("intent", "unknown") for i in interactions))
+            "success_rate": successful / total,
+            "session_duration": str(timedelta(seconds=time.time() - self.conversation_history[0]["timestamp"])),
+            "unique_intents": len(self._intent_counter)
         }
     
     def _load_persistent_data(self):
@@ -1,14 +1,20 @@
 import re
 import json
 import logging
-from typing import Dict, Any, List, Optional
+import time
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime
+from collections import OrderedDict
+from array import array
+
+# Number of distinct cleaned commands whose context-free parse is kept
+PARSE_CACHE_SIZE = 512
 
 class AdvancedIntentParser:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
-        # Enhanced intent patterns
+        # Enhanced intent patterns (compiled once below)
         self.intent_patterns = {
             "system_control": [
                 r"(open|launch|start|run)\s+(\w+)",
@@ -31,9 +37,21 @@ class AdvancedIntentParser:
                 r"(delete|remove)\s+(file|folder)\s+(.+)"
             ]
         }
+        # Input is lowercased before matching, so no IGNORECASE is needed
+        self.intent_patterns = {
+            intent_type: [re.compile(pattern) for pattern in patterns]
+            for intent_type, patterns in self.intent_patterns.items()
+        }
+        # One alternation per pattern family, used to reject non-matching commands in a
+        # single scan before trying the patterns one by one
+        self._multi_step_any = self._combine_patterns(self.intent_patterns["multi_step"])
+        self._single_step_any = self._combine_patterns([
+            pattern for intent_type, patterns in self.intent_patterns.items()
+            if intent_type != "multi_step" for pattern in patterns
+        ])
         
         # App name mapping for better recognition
-        self.app_aliases = {
+        self.app_aliases: Dict[str, str] = {
             "word": "microsoft word",
             "excel": "microsoft excel",
             "chrome": "google chrome",
@@ -44,8 +62,21 @@ class AdvancedIntentParser:
             "vscode": "visual studio code"
         }
         
-        self.correction_history = []
+        # Correction log stored column-wise (one list per field) for cheap aggregation,
+        # e.g. Counter(zip(self._corr_original, self._corr_corrected))
+        self._corr_original: List[str] = []
+        self._corr_corrected: List[str] = []
+        self._corr_timestamp = array('q')  # time.time_ns() readings, packed
+        self._corr_pattern: List[str] = []
+        
+        # Cleaned command -> (is_multi_step, context-free parse), least recently used first
+        self._parse_cache: "OrderedDict[str, Tuple[bool, Dict[str, Any]]]" = OrderedDict()
         
+    @staticmethod
+    def _combine_patterns(patterns: List["re.Pattern"]) -> "re.Pattern":
+        """Join compiled patterns into one alternation that matches if any of them does"""
+        return re.compile("|".join(f"(?:{pattern.pattern})" for pattern in patterns))
+    
     def parse_command(self, user_input: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Parse user command into structured intent with AI enhancement"""
         if context is None:
@@ -53,52 +84,70 @@ class AdvancedIntentParser:
 
         user_input = user_input.strip().lower()
         
-        self.logger.debug(f"Parsing command: '{user_input}'")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Parsing command: '%s'", user_input)
         
-        # Check for multi-step commands first (most complex)
-        multi_step = self._detect_multi_step(user_input)
-        if multi_step:
-            return self._plan_multi_step_execution(multi_step, context)
+        cached = self._parse_cache.get(user_input)
+        if cached is not None:
+            self._parse_cache.move_to_end(user_input)
+        else:
+            # Check for multi-step commands first (most complex)
+            multi_step = self._detect_multi_step(user_input)
+            if multi_step:
+                cached = (True, self._plan_multi_step_execution(multi_step, context))
+            else:
+                # Single-step intent detection
+                cached = (False, self._classify_intent(user_input))
+            self._parse_cache[user_input] = cached
+            if len(self._parse_cache) > PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
         
-        # Single-step intent detection
-        intent_result = self._classify_intent(user_input)
-        return self._enhance_with_context(intent_result, context)
+        # Hand out copies so callers (and context enhancement) never mutate the cached parse
+        is_multi_step, result = cached
+        if is_multi_step:
+            return {**result, "steps": [dict(step) for step in result["steps"]]}
+        return self._enhance_with_context(dict(result), context)
     
     def _detect_multi_step(self, command: str) -> Optional[Dict[str, Any]]:
         """Detect commands that require multiple steps"""
+        if not self._multi_step_any.search(command):
+            return None
         for pattern in self.intent_patterns["multi_step"]:
-            match = re.search(pattern, command)
+            match = pattern.search(command)
             if match:
                 groups = match.groups()
                 return {
                     "type": "multi_step",
                     "primary_action": groups[0],  # open/launch
-                    "target": self._normalize_app_name(groups[8]),  # app name
-                    "connector": groups,  # and/then
-                    "secondary_action": groups if len(groups) > 3 else None,  # what to do
-                    "secondary_target": groups if len(groups) > 4 else None  # content/topic
+                    "target": self._normalize_app_name(groups[1]),  # app name
+                    "connector": groups[2],  # and/then
+                    "secondary_action": groups[3] if len(groups) > 3 else None,  # what to do
+                    "secondary_target": groups[4] if len(groups) > 4 else None  # content/topic
                 }
         return None
     
     def _classify_intent(self, command: str) -> Dict[str, Any]:
         """Classify single-step intents with confidence scoring"""
         best_match = {"intent": "conversation", "confidence": 0.3}
+        # Plain conversation matches no pattern; settle it with one scan
+        if not self._single_step_any.search(command):
+            return best_match
         
         for intent_type, patterns in self.intent_patterns.items():
             if intent_type == "multi_step":
                 continue
                 
             for pattern in patterns:
-                match = re.search(pattern, command)
+                match = pattern.search(command)
                 if match:
-                    groups = match.groups()
-                    confidence = self._calculate_confidence(match, command)
+                    groups: Tuple[Optional[str], ...] = match.groups()
+                    confidence: float = self._calculate_confidence(match, command)
                     
                     if confidence > best_match["confidence"]:
                         best_match = {
                             "intent": intent_type,
                             "action": groups[0],
-                            "target": self._normalize_app_name(groups[8]) if len(groups) >= 2 else None,
+                            "target": self._normalize_app_name(groups[1]) if len(groups) >= 2 else None,
                             "additional": groups if len(groups) >= 3 else None,
                             "confidence": confidence
                         }
@@ -107,7 +156,7 @@ class AdvancedIntentParser:
     
     def _plan_multi_step_execution(self, multi_step: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """Plan execution for multi-step commands with AI enhancement"""
-        steps = []
+        steps: List[Dict[str, Any]] = []
         
         # Step 1: Open/Launch application
         steps.append({
@@ -152,20 +201,13 @@ class AdvancedIntentParser:
         normalized = app_name.lower().strip()
         return self.app_aliases.get(normalized, normalized)
     
-    def _calculate_confidence(self, match, command: str) -> float:
-        """Calculate confidence score for pattern matches"""
-        base_confidence = 0.8
-        
-        # Boost confidence for exact matches
-        if match.group(0) == command.strip():
-            base_confidence += 0.15
-        
-        # Boost for known app names
+    def _calculate_confidence(self, match: "re.Match", command: str) -> float:
+        """Calculate confidence score for pattern matches (command is already stripped and lowercased)"""
         groups = match.groups()
-        if len(groups) >= 2 and groups[1] in self.app_aliases:
-            base_confidence += 0.05
-        
-        return min(1.0, base_confidence)
+        # Exact matches and known app names each add a fixed boost (bools count as 0/1)
+        return min(1.0, 0.8
+                   + 0.15 * (match.group(0) == command)
+                   + 0.05 * (len(groups) >= 2 and groups[1] in self.app_aliases))
     
     def _enhance_with_context(self, intent: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """Enhance intent with contextual information"""
@@ -184,22 +226,36 @@ class AdvancedIntentParser:
         
         return intent
     
-    def learn_from_correction(self, original_command: str, corrected_command: str):
+    def learn_from_correction(self, original_command: str, corrected_command: str) -> None:
         """Learn from user corrections to improve future parsing"""
-        correction = {
-            "original": original_command,
-            "corrected": corrected_command,
-            "timestamp": datetime.now(),
-            "pattern_learned": self._extract_pattern_difference(original_command, corrected_command)
-        }
-        
-        self.correction_history.append(correction)
+        self._corr_original.append(original_command)
+        self._corr_corrected.append(corrected_command)
+        self._corr_timestamp.append(time.time_ns())
+        self._corr_pattern.append(self._extract_pattern_difference(original_command, corrected_command))
         
         # Update app aliases if needed
         self._update_aliases_from_correction(original_command, corrected_command)
+        # Alias changes can alter how cached commands resolve
+        self._parse_cache.clear()
         
         self.logger.info(f"Learning from correction: '{original_command}' -> '{corrected_command}'")
     
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """Yield corrections one dict at a time, built on demand from the columns"""
+        for original, corrected, ts, pattern in zip(
+                self._corr_original, self._corr_corrected, self._corr_timestamp, self._corr_pattern):
+            yield {
+                "original": original,
+                "corrected": corrected,
+                "timestamp": datetime.fromtimestamp(ts / 1e9),
+                "pattern_learned": pattern
+            }
+    
+    @property
+    def correction_history(self) -> List[Dict[str, Any]]:
+        """Corrections as a list of dicts"""
+        return list(self.records())
+    
     def _extract_pattern_difference(self, original: str, corrected: str) -> str:
         """Extract what pattern changed in the correction"""
         # Simple difference detection
@@ -213,7 +269,7 @@ class AdvancedIntentParser:
         
         return f"length_change: {len(orig_words)} -> {len(corr_words)}"
     
-    def _update_aliases_from_correction(self, original: str, corrected: str):
+    def _update_aliases_from_correction(self, original: str, corrected: str) -> None:
         """Update app aliases based on corrections"""
         # Extract potential app names from corrections
         orig_words = original.lower().split()
@@ -109,8 +109,8 @@ class VoiceRecognitionOptimizer:
             "processing_time": time.time()
         }
         
-        self.logger.debug(f"Voice optimization: '{original_text}' -> '{improved_text}' "
-                         f"(confidence: {confidence:.3f} -> {improved_confidence:.3f})")
+        self.logger.debug("Voice optimization: '%s' -> '%s' (confidence: %.3f -> %.3f)",
+                          original_text, improved_text, confidence, improved_confidence)
         
         return result
     
@@ -127,7 +127,7 @@ class VoiceRecognitionOptimizer:
             if original in corrected:
                 corrected = corrected.replace(original, fixed)
                 applied = True
-                self.logger.debug(f"Applied learned correction: {original} -> {fixed}")
+                self.logger.debug("Applied learned correction: %s -> %s", original, fixed)
         
         return corrected, applied
     
@@ -148,7 +148,7 @@ class VoiceRecognitionOptimizer:
             if best_match and best_match != word:
                 words[i] = best_match
                 applied = True
-                self.logger.debug(f"Context correction: {word} -> {best_match}")
+                self.logger.debug("Context correction: %s -> %s", word, best_match)
         
         if applied:
             improved = " ".join(words)
@@ -164,7 +164,7 @@ class VoiceRecognitionOptimizer:
             if wrong in corrected:
                 corrected = corrected.replace(wrong, correct)
                 applied = True
-                self.logger.debug(f"Common correction: {wrong} -> {correct}")
+                self.logger.debug("Common correction: %s -> %s", wrong, correct)
         
         return corrected, applied
     
@@ -195,7 +195,7 @@ class VoiceRecognitionOptimizer:
             if wrong in corrected:
                 corrected = corrected.replace(wrong, correct)
                 applied = True
-                self.logger.debug(f"Phonetic correction: {wrong} -> {correct}")
+                self.logger.debug("Phonetic correction: %s -> %s", wrong, correct)
         
         return corrected, applied
     
@@ -452,7 +452,7 @@ class VoiceInterface:
 
                 if len(buffer) >= max_chunk_samples:
                     voice_detected = self._detect_voice_activity(buffer)
-                    current_time = time.time()
+                    current_time = time.monotonic()
                     
                     if voice_detected and not self.voice_detected:
                         self.voice_detected = True
@@ -161,6 +161,7 @@ class AutonomousAIAssistant:
                     app_name = parameters.get("application", "")
                     result = self.system_controller.open_any_application(app_name)
                     if result["success"]:
+                        self.context_manager.invalidate_active_apps()
                         print(f"✅ {result['message']}")
                 
                 elif action == "close":
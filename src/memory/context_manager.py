@@ -1,4 +1,5 @@
 # Advanced Context Manager
+import time
 import psutil
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
@@ -17,6 +18,11 @@ class AdvancedContextManager:
         self.file_observer.schedule(FileSystemWatcher(self._handle_file_change), path='.', recursive=True)
         self.file_observer.start()
         self.recent_changes: List[str] = []
+        
+        # Running-process names are cached briefly; a turn queries them several times
+        self._proc_cache_ttl = 1.0
+        self._proc_cache_ts = 0.0
+        self._proc_names: List[str] = []
     
     def _handle_file_change(self, path: str, change_type: str):
         self.recent_changes.append(f"{change_type}: {path}")
@@ -25,7 +31,25 @@ class AdvancedContextManager:
     
     def get_active_apps(self) -> List[str]:
         """Get currently running applications"""
-        return [p.info['name'] for p in psutil.process_iter(['name']) if p.info['name']]
+        if time.monotonic() - self._proc_cache_ts < self._proc_cache_ttl:
+            return list(self._proc_names)
+        
+        names: List[str] = []
+        for proc in psutil.process_iter():
+            try:
+                name = proc.name()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            if name:
+                names.append(name)
+        
+        self._proc_names = names
+        self._proc_cache_ts = time.monotonic()
+        return list(names)
+    
+    def invalidate_active_apps(self):
+        """Drop the cached process list, e.g. after launching or closing an app"""
+        self._proc_cache_ts = 0.0
     
     def get_current_context(self) -> Dict[str, Any]:
         """Gather current system context"""
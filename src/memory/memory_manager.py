@@ -4,6 +4,14 @@ from typing import Dict, List, Any, Optional
 import json
 import os
 
+# Optional: faster C serializer for the persistent facts file
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 class ContextualMemoryManager:
     def __init__(self, persistent_file: str = "memory/persistent_facts.json"):
         self.session_memory: deque = deque(maxlen=50)
@@ -12,13 +20,24 @@ class ContextualMemoryManager:
     
     def _load_persistent(self, file_path: str) -> Dict[str, Any]:
         if os.path.exists(file_path):
+            if ORJSON_AVAILABLE:
+                with open(file_path, 'rb') as f:
+                    return orjson.loads(f.read())
             with open(file_path, 'r', encoding='utf-8') as f:
                 return json.load(f)
         return {}
     
     def _save_persistent(self):
-        with open(self.persistent_file, 'w', encoding='utf-8') as f:
-            json.dump(self.persistent_facts, f, indent=2)
+        # Write a sibling temp file and swap it in, so a crash never leaves a truncated file
+        tmp_file = self.persistent_file + ".tmp"
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(self.persistent_facts, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+        else:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.persistent_facts, f, indent=2)
+        os.replace(tmp_file, self.persistent_file)
     
     def add_interaction(self, user_input: str, assistant_response: str, actions_taken: List[str]):
         self.session_memory.append({
@@ -10,6 +10,22 @@ import spacy
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
+# Rule-based patterns, compiled once. Commands are lowercased before matching.
+LIST_APPS_COMMANDS = frozenset(("list applications", "list apps", "show applications", "show apps"))
+REFRESH_APPS_COMMANDS = frozenset(("refresh applications", "rescan applications", "rescan apps", "refresh apps"))
+WHATSAPP_PATTERNS = (
+    re.compile(r"(?:send|message|text|whatsapp)\s+(?:message\s+to\s+)?(\w+)\s+(?:saying\s+)?['\"]?(.+?)['\"]?$"),
+    re.compile(r"(?:message|text)\s+(\w+)\s+(.+)$"),
+)
+SYSTEM_PATTERNS = (
+    re.compile(r"(open|launch|start|close|minimize)\s+(.+)$"),
+)
+CALENDAR_PATTERNS = (
+    re.compile(r"(?:schedule|create|set)\s+(?:meeting|appointment|reminder)\s+(?:with\s+)?(.+?)\s+(?:at|for)\s+(.+)$"),
+)
+TIME_PATTERN = re.compile(r'(\d{1,2}):?(\d{2})?\s*(am|pm)?')
+JSON_OBJECT_PATTERN = re.compile(r'\{.*\}', re.DOTALL)
+
 class CommandParser:
     def __init__(self, model_name="gemma2:2b"):
         self.model_name = model_name
@@ -82,7 +98,7 @@ class CommandParser:
         command_lower = command.lower().strip()
         
         # List and refresh applications patterns
-        if command_lower in ["list applications","list apps","show applications","show apps"]:
+        if command_lower in LIST_APPS_COMMANDS:
             return {
                 "intent": "system_control",
                 "action": "list_apps",
@@ -90,7 +106,7 @@ class CommandParser:
                 "confidence": 0.95,
                 "method": "rule_based"
             }
-        if command_lower in ["refresh applications","rescan applications","rescan apps","refresh apps"]:
+        if command_lower in REFRESH_APPS_COMMANDS:
             return {
                 "intent": "system_control",
                 "action": "refresh_apps",
@@ -100,13 +116,8 @@ class CommandParser:
             }
         
         # WhatsApp patterns
-        whatsapp_patterns = [
-            r"(?:send|message|text|whatsapp)\s+(?:message\s+to\s+)?(\w+)\s+(?:saying\s+)?['\"]?(.+?)['\"]?$",
-            r"(?:message|text)\s+(\w+)\s+(.+)$"
-        ]
-        
-        for pattern in whatsapp_patterns:
-            match = re.search(pattern, command_lower, re.IGNORECASE)
+        for pattern in WHATSAPP_PATTERNS:
+            match = pattern.search(command_lower)
             if match:
                 return {
                     "intent": "whatsapp_send",
@@ -120,12 +131,8 @@ class CommandParser:
                 }
         
         # System control patterns
-        system_patterns = [
-            r"(open|launch|start|close|minimize)\s+(.+)$",
-        ]
-        
-        for pattern in system_patterns:
-            match = re.search(pattern, command_lower, re.IGNORECASE)
+        for pattern in SYSTEM_PATTERNS:
+            match = pattern.search(command_lower)
             if match:
                 return {
                     "intent": "system_control",
@@ -139,12 +146,8 @@ class CommandParser:
                 }
         
         # Calendar patterns with time extraction
-        calendar_patterns = [
-            r"(?:schedule|create|set)\s+(?:meeting|appointment|reminder)\s+(?:with\s+)?(.+?)\s+(?:at|for)\s+(.+)$",
-        ]
-        
-        for pattern in calendar_patterns:
-            match = re.search(pattern, command_lower, re.IGNORECASE)
+        for pattern in CALENDAR_PATTERNS:
+            match = pattern.search(command_lower)
             if match:
                 time_parsed = self._parse_time(match.group(2))
                 return {
@@ -190,7 +193,7 @@ Respond with JSON only:
             
             # Extract JSON from response
             response = result.stdout.strip()
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
+            json_match = JSON_OBJECT_PATTERN.search(response)
             
             if json_match:
                 parsed = json.loads(json_match.group())
@@ -217,7 +220,7 @@ Respond with JSON only:
             base_date = now
         
         # Extract time
-        time_match = re.search(r'(\d{1,2}):?(\d{2})?\s*(am|pm)?', time_str)
+        time_match = TIME_PATTERN.search(time_str)
         if time_match:
             hour = int(time_match.group(1))
             minute = int(time_match.group(2)) if time_match.group(2) else 0
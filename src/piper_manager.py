@@ -49,7 +49,7 @@ class PiperTTSManager:
         self.logger = logging.getLogger(__name__)
         self.model_path = self._find_piper_model()
         self.voice = voice
-        self.audio_queue: queue.Queue = queue.Queue()
+        self.audio_queue: queue.SimpleQueue = queue.SimpleQueue()
         self.is_speaking = False
         self.pyaudio_instance: Optional[Any] = None
         self.audio_stream: Optional[Any] = None
@@ -5,6 +5,9 @@ from sentence_transformers import SentenceTransformer
 from typing import List, Dict, Any
 from .vector_store import LocalVectorStore
 
+# Files embedded per encode call; bounds peak memory and limits what one bad batch loses
+INDEX_BATCH_SIZE = 64
+
 class RetrievalAugmentedGeneration:
     def __init__(self, embedder_model: str = 'all-MiniLM-L6-v2'):
         """Initialize RAG manager with embedder and vector store"""
@@ -25,36 +28,56 @@ class RetrievalAugmentedGeneration:
             return False
         
         try:
-            documents: List[Dict[str, Any]] = []
+            indexed = 0
+            paths: List[str] = []
+            contents: List[str] = []
             for root, _, files in os.walk(directory):
                 for file in files:
                     path = os.path.join(root, file)
                     try:
                         with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-                            embedding = self.embedder.encode(content).tolist()
-                            documents.append({
-                                "id": path,
-                                "embedding": embedding,
-                                "metadata": {"path": path, "content": content[:500]}  # Snippet
-                            })
+                            contents.append(f.read())
+                            paths.append(path)
                     except Exception as e:
                         self.logger.warning(f"Failed to process file {path}: {e}")
                         continue
+                    if len(contents) >= INDEX_BATCH_SIZE:
+                        indexed += self._index_batch(paths, contents)
+                        # Drop the raw text once its snippets are stored
+                        paths, contents = [], []
+            if contents:
+                indexed += self._index_batch(paths, contents)
             
-            if not documents:
+            if not indexed:
                 self.logger.warning("No valid documents found to index")
                 return False
             
-            success = self.vector_store.add_documents(documents)
-            if success:
-                self.logger.info(f"Indexed {len(documents)} documents from {directory}")
-            return success
+            self.logger.info(f"Indexed {indexed} documents from {directory}")
+            return True
             
         except Exception as e:
             self.logger.error(f"Failed to index local files: {e}")
             return False
     
+    def _index_batch(self, paths: List[str], contents: List[str]) -> int:
+        """Embed and store one batch of files; returns the number of documents added"""
+        try:
+            # One batched encode per batch; rows stay float32 ndarrays, which is what Chroma stores anyway
+            embeddings = self.embedder.encode(contents, convert_to_numpy=True)
+            documents: List[Dict[str, Any]] = [
+                {
+                    "id": path,
+                    "embedding": embedding,
+                    "metadata": {"path": path, "content": content[:500]}  # Snippet
+                }
+                for path, content, embedding in zip(paths, contents, embeddings)
+            ]
+            if self.vector_store.add_documents(documents):
+                return len(documents)
+        except Exception as e:
+            self.logger.warning(f"Failed to index batch starting at {paths[0]}: {e}")
+        return 0
+    
     def retrieve_context(self, query: str, top_k: int = 3) -> List[str]:
         """Retrieve context for the given query"""
         try:
@@ -125,44 +125,69 @@ class LocalVectorStore:
             elif query_text is not None:
                 query_params["query_texts"] = [query_text]
             results = self.collection.query(**query_params)
-            formatted_results: List[Dict[str, Any]] = []
-
-            ids_nested = results.get("ids")
-            distances_nested = results.get("distances")
-            metadatas_nested = results.get("metadatas")
-            documents_nested = results.get("documents")
-
-            ids_raw = ids_nested[0] if ids_nested and len(ids_nested) > 0 else []
-            ids: List[str] = ids_raw if isinstance(ids_raw, list) else [ids_raw] if isinstance(ids_raw, str) else []
-            distances: List[float] = distances_nested[0] if distances_nested and len(distances_nested) > 0 else []
-            metadatas_raw = metadatas_nested[0] if metadatas_nested and len(metadatas_nested) > 0 else []
-            documents_raw = documents_nested[0] if documents_nested and len(documents_nested) > 0 else []
-            if isinstance(documents_raw, list):
-                documents: List[str] = documents_raw
-            elif isinstance(documents_raw, str):
-                documents: List[str] = [documents_raw]
-            else:
-                documents: List[str] = []
-
-            metadatas: List[Dict[str, Any]] = [
-                self._convert_metadata(meta) for meta in metadatas_raw
-            ]
-
-            for i in range(len(ids)):
-                result: Dict[str, Any] = {
-                    "id": ids[i],
-                    "distance": distances[i] if i < len(distances) else None,
-                    "score": 1.0 - distances[i] if i < len(distances) else None,
-                    "metadata": metadatas[i] if i < len(metadatas) else {},
-                    "content": documents[i] if i < len(documents) else ""
-                }
-                formatted_results.append(result)
+            formatted_results = self._format_query_results(results, 0)
             self.logger.info(f"Query returned {len(formatted_results)} results")
             return formatted_results
         except Exception as e:
             self.logger.error(f"Query failed: {e}")
             return []
 
+    def query_batch(self, embeddings: List[List[float]], top_k: int = 5,
+                    where: Optional[Dict[str, Any]] = None) -> List[List[Dict[str, Any]]]:
+        """Query the vector store with several embeddings in one call"""
+        if not embeddings:
+            return []
+        try:
+            query_params: Dict[str, Any] = {
+                "n_results": top_k,
+                "query_embeddings": np.array(embeddings, dtype=np.float32)
+            }
+            if where is not None:
+                query_params["where"] = where
+            results = self.collection.query(**query_params)
+            batched = [self._format_query_results(results, i) for i in range(len(embeddings))]
+            self.logger.info(f"Batch query returned {sum(len(r) for r in batched)} results for {len(embeddings)} queries")
+            return batched
+        except Exception as e:
+            self.logger.error(f"Batch query failed: {e}")
+            return [[] for _ in embeddings]
+
+    def _format_query_results(self, results: Any, index: int) -> List[Dict[str, Any]]:
+        """Flatten the index-th query of a ChromaDB query response"""
+        formatted_results: List[Dict[str, Any]] = []
+
+        ids_nested = results.get("ids")
+        distances_nested = results.get("distances")
+        metadatas_nested = results.get("metadatas")
+        documents_nested = results.get("documents")
+
+        ids_raw = ids_nested[index] if ids_nested and len(ids_nested) > index else []
+        ids: List[str] = ids_raw if isinstance(ids_raw, list) else [ids_raw] if isinstance(ids_raw, str) else []
+        distances: List[float] = distances_nested[index] if distances_nested and len(distances_nested) > index else []
+        metadatas_raw = metadatas_nested[index] if metadatas_nested and len(metadatas_nested) > index else []
+        documents_raw = documents_nested[index] if documents_nested and len(documents_nested) > index else []
+        if isinstance(documents_raw, list):
+            documents: List[str] = documents_raw
+        elif isinstance(documents_raw, str):
+            documents: List[str] = [documents_raw]
+        else:
+            documents: List[str] = []
+
+        metadatas: List[Dict[str, Any]] = [
+            self._convert_metadata(meta) for meta in metadatas_raw
+        ]
+
+        for i in range(len(ids)):
+            result: Dict[str, Any] = {
+                "id": ids[i],
+                "distance": distances[i] if i < len(distances) else None,
+                "score": 1.0 - distances[i] if i < len(distances) else None,
+                "metadata": metadatas[i] if i < len(metadatas) else {},
+                "content": documents[i] if i < len(documents) else ""
+            }
+            formatted_results.append(result)
+        return formatted_results
+
     def delete_documents(self, ids: List[str]) -> bool:
         """Delete documents by IDs"""
         try:
@@ -0,0 +1,28 @@
+import os
+import sys
+from unittest import mock
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.controllers.whatsapp_controller import WhatsAppController
+
+def test_get_recent_messages_returns_text():
+    """Message extraction must return the message text, not an empty list"""
+    controller = WhatsAppController()
+    controller.driver = mock.Mock()
+    controller.driver.execute_script.return_value = ["hello", "", "how are you?"]
+
+    messages = controller.get_recent_messages(count=3)
+
+    assert messages == ["hello", "how are you?"]
+    args = controller.driver.execute_script.call_args[0]
+    assert args[1] == WhatsAppController._MESSAGES_CSS
+    assert args[2] == 3
+
+def test_contact_name_is_quoted():
+    """Contact names with quotes must not break the title selector"""
+    assert WhatsAppController._css_string("Rahul's Phone") == '"Rahul\'s Phone"'
+    assert WhatsAppController._css_string('Say "hi"') == '"Say \\"hi\\""'
+
+if __name__ == "__main__":
+    test_get_recent_messages_returns_text()
+    test_contact_name_is_quoted()
+    print("✅ WhatsApp controller tests passed!")